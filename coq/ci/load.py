@@ -7,7 +7,6 @@ from urllib.parse import urlparse
 
 from std2.asyncio.subprocess import call
 from std2.pickle import new_decoder, new_encoder
-from std2.tree import recur_sort
 from yaml import safe_load
 
 from ..consts import COMPILATION_YML, TMP_DIR
@@ -19,6 +18,8 @@ from ..snippets.parsers.parser import ParseError
 from ..snippets.types import ASnips, ParsedSnippet
 from .types import Compilation
 
+_PARSE_CACHE = TMP_DIR / "snippets.pickle"
+
 
 def _p_name(uri: str) -> Path:
     return TMP_DIR / Path(urlparse(uri).path).name
@@ -63,6 +64,7 @@ async def load() -> ASnips:
         lsp={str(path): TMP_DIR / path for path in specs.paths.lsp},
         neosnippet={str(path): TMP_DIR / path for path in specs.paths.neosnippet},
         ultisnip={str(path): TMP_DIR / path for path in specs.paths.ultisnip},
+        cache=_PARSE_CACHE,
     )
     return parsed
 
@@ -98,4 +100,4 @@ async def load_parsable() -> Any:
                     acc.append(snip)
 
     coder = new_encoder(ASnips)
-    return recur_sort(coder(meta))
+    return coder(meta)
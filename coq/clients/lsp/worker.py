@@ -1,16 +1,23 @@
-from asyncio import as_completed, gather
+from asyncio import AbstractEventLoop, Queue, gather
 from enum import Enum, auto
 from itertools import chain
-from typing import AsyncIterator, Iterator, MutableSequence, Optional, Tuple
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Iterator,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from std2 import anext
 from std2.aitertools import to_async
-from std2.asyncio import pure
+from std2.asyncio import cancel
 from std2.itertools import chunk
 
 from ...lsp.requests.completion import request
 from ...lsp.types import LSPcomp
-from ...shared.fuzzy import multi_set_ratio
+from ...shared.fuzzy import multi_set_ratios
 from ...shared.parse import is_word, lower
 from ...shared.runtime import Supervisor
 from ...shared.runtime import Worker as BaseWorker
@@ -26,6 +33,26 @@ class _Src(Enum):
     from_query = auto()
 
 
+_EMPTY_LSP = LSPcomp(local_cache=False, items=iter(()))
+
+
+def _survivors(
+    cword: str,
+    idxs: Sequence[int],
+    choices: Sequence[str],
+    look_ahead: int,
+    fuzzy_cutoff: float,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Score a whole batch at once, yield only (idx, cword) above the cutoff
+    """
+
+    ratios = multi_set_ratios(cword, rhs=choices, look_ahead=look_ahead)
+    for idx, ratio in zip(idxs, ratios):
+        if ratio >= fuzzy_cutoff:
+            yield idx, cword
+
+
 class Worker(BaseWorker[LSPClient, None], CacheWorker):
     def __init__(self, supervisor: Supervisor, options: LSPClient, misc: None) -> None:
         self._local_cached: MutableSequence[Iterator[Completion]] = []
@@ -35,15 +62,21 @@ class Worker(BaseWorker[LSPClient, None], CacheWorker):
     async def work(self, context: Context) -> AsyncIterator[Optional[Completion]]:
         w_before, sw_before = lower(context.words_before), lower(context.syms_before)
         limit = BIGGEST_INT if context.manual else self._supervisor.options.max_results
+        unifying_chars = self._supervisor.options.unifying_chars
+        look_ahead = self._supervisor.options.look_ahead
+        fuzzy_cutoff = self._supervisor.options.fuzzy_cutoff
 
         use_cache, cached, set_cache = self._use_cache(context)
         if not use_cache:
             self._local_cached.clear()
 
         async def cached_iters() -> Tuple[_Src, LSPcomp]:
-            items = map(sanitize_cached, chain(*self._local_cached))
-            self._local_cached.clear()
-            return _Src.from_stored, LSPcomp(local_cache=True, items=items)
+            if not self._local_cached:
+                return _Src.from_stored, _EMPTY_LSP
+            else:
+                items = map(sanitize_cached, chain(*self._local_cached))
+                self._local_cached.clear()
+                return _Src.from_stored, LSPcomp(local_cache=True, items=items)
 
         async def cached_db_items() -> Tuple[_Src, LSPcomp]:
             items = await cached
@@ -62,20 +95,46 @@ class Worker(BaseWorker[LSPClient, None], CacheWorker):
                 else to_async(())
             )
 
-            for fut in as_completed(
-                (
-                    cached_iters(),
-                    cached_db_items(),
-                    gather(
-                        pure(_Src.from_query),
-                        anext(stream, LSPcomp(local_cache=False, items=iter(()))),
-                    ),
-                )
-            ):
-                yield await fut
+            async def once(
+                aw: Awaitable[Tuple[_Src, LSPcomp]]
+            ) -> AsyncIterator[Tuple[_Src, LSPcomp]]:
+                yield await aw
+
+            async def queried() -> AsyncIterator[Tuple[_Src, LSPcomp]]:
+                async for lc in stream:
+                    yield _Src.from_query, lc
+
+            producers = (once(cached_iters()), once(cached_db_items()), queried())
+            queue: Queue = Queue(maxsize=len(producers))
+
+            async def produce(ait: AsyncIterator[Tuple[_Src, LSPcomp]]) -> None:
+                try:
+                    async for item in ait:
+                        await queue.put(item)
+                except Exception as e:
+                    await queue.put(e)
+                else:
+                    await queue.put(None)
+
+            loop: AbstractEventLoop = self._supervisor.nvim.loop
+            tasks = tuple(loop.create_task(produce(ait)) for ait in producers)
+            try:
+                alive = len(tasks)
+                while alive:
+                    item = await queue.get()
+                    if item is None:
+                        alive -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                await cancel(gather(*tasks))
 
-            async for lc in stream:
-                yield _Src.from_query, lc
+        w_idxs: MutableSequence[int] = []
+        w_choices: MutableSequence[str] = []
+        s_idxs: MutableSequence[int] = []
+        s_choices: MutableSequence[str] = []
 
         seen = 0
         async for src, lsp_comps in stream():
@@ -91,24 +150,40 @@ class Worker(BaseWorker[LSPClient, None], CacheWorker):
                             yield c
                             seen += 1
                     else:
-                        for c in chunked:
-                            cword = (
-                                w_before
-                                if is_word(
-                                    c.sort_by[:1],
-                                    unifying_chars=self._supervisor.options.unifying_chars,
-                                )
-                                else sw_before
-                            )
-                            ratio = multi_set_ratio(
-                                cword,
-                                lower(c.sort_by),
-                                look_ahead=self._supervisor.options.look_ahead,
+                        w_idxs.clear()
+                        w_choices.clear()
+                        s_idxs.clear()
+                        s_choices.clear()
+                        for idx, c in enumerate(chunked):
+                            if is_word(c.sort_by[:1], unifying_chars=unifying_chars):
+                                w_idxs.append(idx)
+                                w_choices.append(lower(c.sort_by))
+                            else:
+                                s_idxs.append(idx)
+                                s_choices.append(lower(c.sort_by))
+
+                        survivors = sorted(
+                            chain(
+                                _survivors(
+                                    w_before,
+                                    idxs=w_idxs,
+                                    choices=w_choices,
+                                    look_ahead=look_ahead,
+                                    fuzzy_cutoff=fuzzy_cutoff,
+                                ),
+                                _survivors(
+                                    sw_before,
+                                    idxs=s_idxs,
+                                    choices=s_choices,
+                                    look_ahead=look_ahead,
+                                    fuzzy_cutoff=fuzzy_cutoff,
+                                ),
                             )
+                        )
+                        for idx, cword in survivors:
+                            c = chunked[idx]
                             if (
-                                ratio >= self._supervisor.options.fuzzy_cutoff
-                                and len(c.sort_by) + self._supervisor.options.look_ahead
-                                >= len(cword)
+                                len(c.sort_by) + look_ahead >= len(cword)
                                 and not cword.startswith(c.sort_by)
                             ):
                                 yield c
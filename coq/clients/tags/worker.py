@@ -1,5 +1,6 @@
 from asyncio import gather
 from contextlib import suppress
+from functools import lru_cache
 from os import linesep
 from os.path import normcase
 from pathlib import Path, PurePath
@@ -11,11 +12,12 @@ from typing import (
     Iterator,
     Mapping,
     MutableSet,
+    Optional,
+    Sequence,
     Tuple,
 )
 
-from pynvim.api.nvim import Nvim, NvimError
-from pynvim_pp.api import buf_name, list_bufs
+from pynvim.api.nvim import Nvim
 from pynvim_pp.lib import async_call, go
 from std2.asyncio import run_in_executor
 
@@ -26,18 +28,26 @@ from ...shared.runtime import Worker as BaseWorker
 from ...shared.settings import TagsClient
 from ...shared.timeit import timeit
 from ...shared.types import Completion, Context, Doc, Edit
-from ...tags.parse import parse, run
+from ...tags.parse import parse, stream
 from ...tags.types import Tag
 
+_LS_LUA = """
+local names = {}
+for _, buf in ipairs(vim.api.nvim_list_bufs()) do
+  if vim.api.nvim_buf_get_option(buf, "buflisted") then
+    table.insert(names, vim.api.nvim_buf_get_name(buf))
+  end
+end
+return names
+"""
+
 
 async def _ls(nvim: Nvim) -> AbstractSet[str]:
-    def cont() -> Iterator[str]:
-        for buf in list_bufs(nvim, listed=True):
-            with suppress(NvimError):
-                filename = buf_name(nvim, buf=buf)
-                yield filename
+    def cont() -> AbstractSet[str]:
+        names: Sequence[str] = nvim.api.exec_lua(_LS_LUA, ())
+        return {*names}
 
-    return await async_call(nvim, lambda: {*cont()})
+    return await async_call(nvim, cont)
 
 
 async def _mtimes(paths: AbstractSet[str]) -> Mapping[str, float]:
@@ -51,76 +61,69 @@ async def _mtimes(paths: AbstractSet[str]) -> Mapping[str, float]:
     return await run_in_executor(c2)
 
 
-def _doc(client: TagsClient, context: Context, tag: Tag) -> Doc:
+@lru_cache(maxsize=4096)
+def _doc_text(
+    client: TagsClient,
+    cwd: PurePath,
+    filename: str,
+    comment: Tuple[str, str],
+    path: str,
+    line: int,
+    kind: str,
+    pattern: str,
+    scope_kind: Optional[str],
+    scope: Optional[str],
+    access: Optional[str],
+    typeref: Optional[str],
+) -> str:
     def cont() -> Iterator[str]:
-        lc, rc = context.comment
-        path, cfn = PurePath(tag["path"]), PurePath(context.filename)
-        if path == cfn:
+        lc, rc = comment
+        if PurePath(path) == PurePath(filename):
             pos = "."
         else:
-            pos = show_path(context.cwd, path=path, is_dir=False)
+            pos = show_path(cwd, path=PurePath(path), is_dir=False)
 
-        yield lc
-        yield pos
-        yield ":"
-        yield str(tag["line"])
-        yield rc
-        yield linesep
+        yield f"{lc}{pos}:{line}{rc}{linesep}"
 
-        scope_kind = tag["scopeKind"] or None
-        scope = tag["scope"] or None
+        sep, parent = client.path_sep, client.parent_scope
 
         if scope_kind and scope:
-            yield lc
-            yield scope_kind
-            yield client.path_sep
-            yield scope
-            yield client.parent_scope
-            yield rc
-            yield linesep
+            yield f"{lc}{scope_kind}{sep}{scope}{parent}{rc}{linesep}"
         elif scope_kind:
-            yield lc
-            yield scope_kind
-            yield client.parent_scope
-            yield rc
-            yield linesep
+            yield f"{lc}{scope_kind}{parent}{rc}{linesep}"
         elif scope:
-            yield lc
-            yield scope
-            yield client.parent_scope
-            yield rc
-            yield linesep
-
-        access = tag["access"] or None
-        _, _, ref = (tag.get("typeref") or "").partition(":")
+            yield f"{lc}{scope}{parent}{rc}{linesep}"
+
+        _, _, ref = (typeref or "").partition(":")
         if access and ref:
-            yield lc
-            yield access
-            yield client.path_sep
-            yield tag["kind"]
-            yield client.path_sep
-            yield ref
-            yield rc
-            yield linesep
+            yield f"{lc}{access}{sep}{kind}{sep}{ref}{rc}{linesep}"
         elif access:
-            yield lc
-            yield access
-            yield client.path_sep
-            yield tag["kind"]
-            yield rc
-            yield linesep
+            yield f"{lc}{access}{sep}{kind}{rc}{linesep}"
         elif ref:
-            yield lc
-            yield tag["kind"]
-            yield client.path_sep
-            yield ref
-            yield rc
-            yield linesep
+            yield f"{lc}{kind}{sep}{ref}{rc}{linesep}"
+
+        yield pattern
 
-        yield tag["pattern"]
+    return "".join(cont())
 
+
+def _doc(client: TagsClient, context: Context, tag: Tag) -> Doc:
+    text = _doc_text(
+        client,
+        cwd=context.cwd,
+        filename=context.filename,
+        comment=context.comment,
+        path=tag["path"],
+        line=tag["line"],
+        kind=tag["kind"],
+        pattern=tag["pattern"],
+        scope_kind=tag["scopeKind"] or None,
+        scope=tag["scope"] or None,
+        access=tag["access"] or None,
+        typeref=tag.get("typeref"),
+    )
     doc = Doc(
-        text="".join(cont()),
+        text=text,
         syntax=context.filetype,
     )
     return doc
@@ -144,8 +147,9 @@ class Worker(BaseWorker[TagsClient, CTDB]):
                     for path, mtime in mtimes.items()
                     if mtime > existing.get(path, 0)
                 )
-                raw = await run(*query_paths) if query_paths else ""
-                new = parse(mtimes, raw=raw)
+                new = await run_in_executor(
+                    lambda: parse(mtimes, lines=stream(*query_paths))
+                )
                 dead = existing.keys() - mtimes.keys()
                 await self._misc.reconciliate(dead, new=new)
 
@@ -6,7 +6,6 @@ from os import linesep
 from pathlib import Path
 from typing import (
     Any,
-    Callable,
     Iterator,
     Mapping,
     Optional,
@@ -80,6 +79,10 @@ class _Pos:
     width: int
 
 
+# row, col, height, width
+_Geom = Tuple[int, int, int, int]
+
+
 def _ls(nvim: Nvim) -> Iterator[Window]:
     for win in list_wins(nvim):
         if win_get_var(nvim, win=win, key=_FLOAT_WIN_UUID):
@@ -122,16 +125,12 @@ def _preprocess(context: Context, doc: Doc) -> Doc:
         return doc
 
 
-def _clamp(hi: int) -> Callable[[int], int]:
-    return lambda i: clamp(1, i, hi)
-
-
 def _positions(
     display: PreviewDisplay,
     event: _Event,
     lines: Sequence[str],
     state: State,
-) -> Iterator[Tuple[int, int, _Pos]]:
+) -> Iterator[Tuple[int, int, _Geom]]:
     scr_width, scr_height = state.screen
     top, btm, left, right = (
         event.row,
@@ -139,56 +138,38 @@ def _positions(
         event.col,
         event.col + event.width + event.scrollbar,
     )
-    dls = tuple(display_width(line, tabsize=state.context.tabstop) for line in lines)
-    limit_w = _clamp(min(display.x_max_len, max(chain((0,), dls))))
-    limit_h = _clamp(sum(ceil((dl or 1) / display.x_max_len) for dl in dls))
+    dls = tuple(
+        len(line)
+        if line.isascii() and line.isprintable()
+        else display_width(line, tabsize=state.context.tabstop)
+        for line in lines
+    )
+    max_w = min(display.x_max_len, max(chain((0,), dls)))
+    max_h = sum(ceil((dl or 1) / display.x_max_len) for dl in dls)
 
-    ns_width = limit_w(scr_width - left)
-    n_height = limit_h(top - 1)
+    ns_width = clamp(1, scr_width - left, max_w)
+    n_height = clamp(1, top - 1, max_h)
     b_width, b_height = border_w_h(display.border)
 
     ns_col = left - 1
-    n = _Pos(
-        row=top - 1 - n_height - b_height,
-        col=ns_col,
-        height=n_height,
-        width=ns_width,
-    )
-    if n.row > 1 and display.positions.north is not None:
-        yield 1, display.positions.north, n
-
-    s = _Pos(
-        row=btm,
-        col=ns_col,
-        height=limit_h(scr_height - btm),
-        width=ns_width,
-    )
-
-    if s.row + s.height < scr_height - 1 and display.positions.south is not None:
-        yield 2, display.positions.south, s
+    n_row = top - 1 - n_height - b_height
+    if n_row > 1 and display.positions.north is not None:
+        yield 1, display.positions.north, (n_row, ns_col, n_height, ns_width)
 
-    we_height = limit_h(scr_height - top - 2)
-    w_width = limit_w(left - 2)
+    s_height = clamp(1, scr_height - btm, max_h)
+    if btm + s_height < scr_height - 1 and display.positions.south is not None:
+        yield 2, display.positions.south, (btm, ns_col, s_height, ns_width)
 
-    w = _Pos(
-        row=top,
-        col=left - 2 - w_width - b_width,
-        height=we_height,
-        width=w_width,
-    )
+    we_height = clamp(1, scr_height - top - 2, max_h)
+    w_width = clamp(1, left - 2, max_w)
 
     if display.positions.west is not None:
-        yield 3, display.positions.west, w
-
-    e = _Pos(
-        row=top,
-        col=right + 1,
-        height=we_height,
-        width=limit_w(scr_width - right - 2),
-    )
+        w_col = left - 2 - w_width - b_width
+        yield 3, display.positions.west, (top, w_col, we_height, w_width)
 
     if display.positions.east is not None:
-        yield 4, display.positions.east, e
+        e_width = clamp(1, scr_width - right - 2, max_w)
+        yield 4, display.positions.east, (top, right + 1, we_height, e_width)
 
 
 def _set_win(nvim: Nvim, display: PreviewDisplay, buf: Buffer, pos: _Pos) -> None:
@@ -234,13 +215,14 @@ def _show_preview(
     lines = text.splitlines()
     pit = _positions(stack.settings.display.preview, event=event, lines=lines, state=s)
 
-    def key(k: Tuple[int, int, _Pos]) -> Tuple[int, int, int, int]:
-        idx, rank, pos = k
-        return pos.height * pos.width, idx == s.pum_location, -rank, -idx
+    def key(k: Tuple[int, int, _Geom]) -> Tuple[int, int, int, int]:
+        idx, rank, (_, _, height, width) = k
+        return height * width, idx == s.pum_location, -rank, -idx
 
-    ordered = sorted(pit, key=key, reverse=True)
-    if ordered:
-        (pum_location, _, pos), *__ = ordered
+    best = max(pit, key=key, default=None) if lines else None
+    if best:
+        pum_location, _, (row, col, height, width) = best
+        pos = _Pos(row=row, col=col, height=height, width=width)
         state(pum_location=pum_location)
         nvim.api.exec_lua(
             f"{_go_show.name}(...)",
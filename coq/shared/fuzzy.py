@@ -1,6 +1,9 @@
 from collections import Counter
 from dataclasses import dataclass
-from typing import Iterable, MutableMapping
+from typing import Iterable, MutableMapping, MutableSequence, Sequence, Tuple
+
+from rapidfuzz.distance import LCSseq
+from rapidfuzz.process import extract
 
 
 @dataclass(frozen=True)
@@ -40,6 +43,42 @@ def multi_set_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
         return ratio / adjust
 
 
+def multi_set_ratios(
+    lhs: str, rhs: Sequence[str], look_ahead: int
+) -> Sequence[float]:
+    """
+    Batched `multi_set_ratio`, same scores
+
+    Multiset intersection == LCS of the sorted strings
+    """
+
+    ratios = [1.0] * len(rhs)
+    groups: MutableMapping[str, Tuple[MutableSequence[int], MutableSequence[str]]] = {}
+
+    for idx, r in enumerate(rhs):
+        shorter = min(len(lhs), len(r))
+        if shorter:
+            cutoff = shorter + look_ahead
+            idxs, choices = groups.setdefault(lhs[:cutoff], ([], []))
+            idxs.append(idx)
+            choices.append("".join(sorted(r[:cutoff])))
+
+    for l, (idxs, choices) in groups.items():
+        for choice, intersection, i in extract(
+            "".join(sorted(l)),
+            choices,
+            scorer=LCSseq.similarity,
+            processor=None,
+            limit=None,
+        ):
+            shorter, longer = sorted((len(l), len(choice)))
+            ratio = 1 - (longer - intersection) / longer
+            adjust = shorter / longer
+            ratios[idxs[i]] = ratio / adjust
+
+    return ratios
+
+
 def quick_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
     """
     Front end bias
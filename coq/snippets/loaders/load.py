@@ -1,12 +1,20 @@
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from multiprocessing import cpu_count, get_context
+from os import getpid
+from pathlib import Path, PurePath
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler, UnpicklingError
 from typing import (
     AbstractSet,
+    Callable,
+    Iterable,
     Iterator,
     Literal,
     Mapping,
     MutableMapping,
     MutableSequence,
     MutableSet,
+    Optional,
     Sequence,
     Tuple,
     cast,
@@ -34,10 +42,97 @@ def _load_paths(
     return meta
 
 
+_Parsed = Tuple[AbstractSet[str], Sequence[ParsedSnippet]]
+_Parser = Callable[[PurePath, Iterable[Tuple[int, str]]], _Parsed]
+
+# Spawning a worker costs ~100ms, parsing a 40 snippet file ~0.25ms
+_PROCESS_THRESHOLD = 512
+_CHUNK_SIZE = 8
+
+
+def _read(path: Path) -> Sequence[str]:
+    with path.open(encoding="UTF-8") as fd:
+        return tuple(fd)
+
+
+def _parse_one(task: Tuple[_Parser, Path]) -> _Parsed:
+    parser, path = task
+    return parser(path, enumerate(_read(path), start=1))
+
+
+def _parse(tasks: Sequence[Tuple[_Parser, Path]]) -> Iterator[_Parsed]:
+    workers = min(cpu_count(), len(tasks) // _CHUNK_SIZE)
+    if workers < 2 or len(tasks) < _PROCESS_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(32, len(tasks)) or 1) as pool:
+            texts = pool.map(lambda task: _read(task[-1]), tasks)
+            for (parser, path), lines in zip(tasks, texts):
+                yield parser(path, enumerate(lines, start=1))
+    else:
+        # `spawn`, forking from inside a running event loop is not safe
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn")
+        ) as pool:
+            yield from pool.map(_parse_one, tasks, chunksize=_CHUNK_SIZE)
+
+
+_Key = Tuple[str, str, int, int]
+
+
+def _key(parser: _Parser, path: Path) -> _Key:
+    stat = path.stat()
+    return parser.__module__, str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _version() -> Tuple[int, ...]:
+    """
+    Invalidate everything if the parsers themselves change
+    """
+
+    loaders = Path(__file__).resolve().parent
+    srcs = (*loaders.glob("*.py"), loaders.parent / "types.py")
+    return tuple(sorted(src.stat().st_mtime_ns for src in srcs))
+
+
+def _load_cache(cache: Path, version: Tuple[int, ...]) -> Mapping[_Key, _Parsed]:
+    """
+    The version header is a plain tuple, checked before the body is unpickled
+    """
+
+    with suppress(
+        OSError,
+        EOFError,
+        UnpicklingError,
+        ValueError,
+        TypeError,
+        AttributeError,
+        ImportError,
+    ):
+        with cache.open("rb") as fd:
+            unpickler = Unpickler(fd)
+            if unpickler.load() == version:
+                parsed = unpickler.load()
+                if isinstance(parsed, Mapping):
+                    return cast(Mapping[_Key, _Parsed], parsed)
+    return {}
+
+
+def _dump_cache(
+    cache: Path, version: Tuple[int, ...], parsed: Mapping[_Key, _Parsed]
+) -> None:
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache.with_name(f"{cache.name}.{getpid()}")
+    with tmp.open("wb") as fd:
+        pickler = Pickler(fd, protocol=HIGHEST_PROTOCOL)
+        pickler.dump(version)
+        pickler.dump(parsed)
+    tmp.replace(cache)
+
+
 def load(
     lsp: Mapping[str, Path],
     neosnippet: Mapping[str, Path],
     ultisnip: Mapping[str, Path],
+    cache: Optional[Path] = None,
 ) -> ASnips:
     specs = {
         parse_lsp: _load_paths(lsp, exts={".json"}),
@@ -45,13 +140,30 @@ def load(
         parse_ultisnip: _load_paths(ultisnip, exts={".snippets", ".snip"}),
     }
 
+    tasks = tuple(
+        (parser, label, ext, path)
+        for parser, spec in specs.items()
+        for label, sp in spec.items()
+        for ext, path in sp
+    )
+
+    version = _version()
+    cached = _load_cache(cache, version=version) if cache else {}
+    keys = tuple(_key(parser, path=path) for parser, _, _, path in tasks)
+    misses = {
+        key: (parser, path)
+        for (parser, _, _, path), key in zip(tasks, keys)
+        if key not in cached
+    }
+    fresh = dict(zip(misses.keys(), _parse(tuple(misses.values()))))
+    parsed = {key: fresh[key] if key in fresh else cached[key] for key in keys}
+
+    if cache and parsed.keys() != cached.keys():
+        _dump_cache(cache, version=version, parsed=parsed)
+
     def c1() -> Iterator[Tuple[str, str, AbstractSet[str], Sequence[ParsedSnippet]]]:
-        for parser, spec in specs.items():
-            for label, sp in spec.items():
-                for ext, path in sp:
-                    with path.open(encoding="UTF-8") as fd:
-                        parsed = parser(path, enumerate(fd, start=1))
-                    yield label, ext, *parsed
+        for (_, label, ext, _), key in zip(tasks, keys):
+            yield label, ext, *parsed[key]
 
     meta: MutableMapping[
         str,
@@ -69,8 +69,7 @@ def parse(
         line = line.rstrip()
         if (
             not line
-            or line.isspace()
-            or line.startswith(_COMMENT_START)
+            or line[:1] == _COMMENT_START
             or any(line.startswith(i) for i in _IGNORED_STARTS)
         ):
             pass
@@ -1,8 +1,18 @@
 from difflib import get_close_matches
 from enum import Enum, auto
+from functools import lru_cache
 from os import linesep
 from pathlib import PurePath
-from typing import AbstractSet, Iterable, MutableSequence, MutableSet, Sequence, Tuple
+from re import compile, escape
+from typing import (
+    AbstractSet,
+    Iterable,
+    MutableSequence,
+    MutableSet,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from ..types import ParsedSnippet
 from .parse import raise_err
@@ -30,6 +40,23 @@ _LEGAL_STARTS = {
     _SNIPPET_START,
 }
 
+_IGNORE_RE = "|".join(map(escape, (_COMMENT_START, *sorted(_IGNORE_STARTS))))
+_NORMAL_DISPATCH = compile(
+    "|".join(
+        (
+            f"(?P<ignore>{_IGNORE_RE})",
+            f"(?P<extends>{escape(_EXTENDS_START)})",
+            f"(?P<snippet>{escape(_SNIPPET_START)})",
+            f"(?P<global>{escape(_GLOBAL_START)})",
+        )
+    )
+)
+
+# name, then either exactly one "quoted" label, or the raw remainder
+_SNIPPET_HEAD = compile(
+    r'(?P<name>[^ ]*)(?: (?:"(?P<quoted>[^"]*)"[^"]*|(?P<label>.*)))?'
+)
+
 
 class _State(Enum):
     normal = auto()
@@ -37,14 +64,22 @@ class _State(Enum):
     pglobal = auto()
 
 
+@lru_cache(maxsize=256)
+def _suggest(start: str) -> Optional[str]:
+    close = get_close_matches(start, _LEGAL_STARTS, n=1)
+    if close:
+        maybe_start, *_ = close
+        return maybe_start
+    else:
+        return None
+
+
 def _start(line: str) -> Tuple[str, str]:
     rest = line[len(_SNIPPET_START) :].strip()
-    name, _, label = rest.partition(" ")
-    if label.startswith('"') and label[1:].count('"') == 1:
-        quoted, _, _ = label[1:].partition('"')
-        return name, quoted
-    else:
-        return name, label
+    match = _SNIPPET_HEAD.fullmatch(rest)
+    assert match
+    name, quoted, label = match.group("name", "quoted", "label")
+    return name, quoted if quoted is not None else label or ""
 
 
 def parse(
@@ -62,32 +97,29 @@ def parse(
         line = line.rstrip()
 
         if state == _State.normal:
-            if (
-                not line
-                or line.isspace()
-                or line.startswith(_COMMENT_START)
-                or any(line.startswith(ignore) for ignore in _IGNORE_STARTS)
-            ):
+            match = _NORMAL_DISPATCH.match(line)
+            dispatch = match.lastgroup if match else None
+
+            if not line or dispatch == "ignore":
                 pass
 
-            elif line.startswith(_EXTENDS_START):
+            elif dispatch == "extends":
                 filetypes = line[len(_EXTENDS_START) :].strip()
                 for filetype in filetypes.split(","):
                     extends.add(filetype.strip())
 
-            elif line.startswith(_SNIPPET_START):
+            elif dispatch == "snippet":
                 state = _State.snippet
 
                 current_name, current_label = _start(line)
 
-            elif line.startswith(_GLOBAL_START):
+            elif dispatch == "global":
                 state = _State.pglobal
 
             else:
                 start, _, _ = line.partition(" ")
-                close = get_close_matches(start, _LEGAL_STARTS, n=1)
-                if close:
-                    maybe_start, *_ = close
+                maybe_start = _suggest(start)
+                if maybe_start:
                     addendum = f" :: did you mean -- {maybe_start}"
                 else:
                     addendum = ""
@@ -1,9 +1,17 @@
 from json import loads
 from json.decoder import JSONDecodeError
-from typing import Iterator, Mapping, MutableMapping, MutableSequence, Tuple
+from subprocess import DEVNULL, PIPE, Popen
+from typing import (
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+    Tuple,
+)
 
 from pynvim_pp.logging import log
-from std2.asyncio.subprocess import call
 from std2.string import removeprefix, removesuffix
 
 from .types import Tag, Tags
@@ -26,23 +34,34 @@ _FIELDS = "".join(
 )
 
 
-async def run(*args: str) -> str:
-    if not args:
-        return ""
-    else:
+def _cmd(*args: str) -> Sequence[str]:
+    return (
+        "ctags",
+        "--sort=no",
+        "--output-format=json",
+        f"--fields={_FIELDS}",
+        *args,
+    )
+
+
+def stream(*args: str) -> Iterator[str]:
+    """
+    Yields lines as `ctags` emits them
+    """
+
+    if args:
         try:
-            proc = await call(
-                "ctags",
-                "--sort=no",
-                "--output-format=json",
-                f"--fields={_FIELDS}",
-                *args,
-                check_returncode=set(),
-            )
+            with Popen(
+                _cmd(*args),
+                stdin=DEVNULL,
+                stdout=PIPE,
+                stderr=DEVNULL,
+                encoding="UTF-8",
+            ) as proc:
+                assert proc.stdout
+                yield from proc.stdout
         except FileNotFoundError:
-            return ""
-        else:
-            return proc.out.decode()
+            pass
 
 
 def _unescape(pattern: str) -> str:
@@ -60,11 +79,11 @@ def _unescape(pattern: str) -> str:
     return "".join(cont())
 
 
-def parse(mtimes: Mapping[str, float], raw: str) -> Tags:
+def parse(mtimes: Mapping[str, float], lines: Iterable[str]) -> Tags:
     tags: MutableMapping[str, Tuple[str, float, MutableSequence[Tag]]] = {}
 
-    for line in raw.splitlines():
-        if line:
+    for line in lines:
+        if line and not line.isspace():
             try:
                 json = loads(line)
             except JSONDecodeError:
@@ -1,6 +1,15 @@
 from asyncio import gather
 from dataclasses import dataclass
-from typing import AbstractSet, Iterator, Mapping, Optional, Tuple
+from typing import (
+    AbstractSet,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import uuid4
 
 from std2.asyncio.subprocess import call
 
@@ -14,6 +23,9 @@ class _Pane:
     window_active: bool
 
 
+_SHOTS: MutableMapping[str, Tuple[int, Sequence[str]]] = {}
+
+
 async def _panes() -> Iterator[_Pane]:
     try:
         proc = await call(
@@ -52,9 +64,22 @@ async def cur() -> Optional[_Pane]:
         return None
 
 
+def _words(unifying_chars: AbstractSet[str], uid: str, text: str) -> Sequence[str]:
+    key = hash(text)
+    cached = _SHOTS.get(uid)
+    if cached:
+        prev, words = cached
+        if prev == key:
+            return words
+
+    words = tuple(coalesce(text, unifying_chars=unifying_chars))
+    _SHOTS[uid] = (key, words)
+    return words
+
+
 async def _screenshot(
     unifying_chars: AbstractSet[str], uid: str
-) -> Tuple[str, Iterator[str]]:
+) -> Tuple[str, Sequence[str]]:
     try:
         proc = await call(
             "tmux",
@@ -65,24 +90,56 @@ async def _screenshot(
             check_returncode=set(),
         )
     except FileNotFoundError:
-        return uid, iter(())
+        return uid, ()
     else:
         if proc.code:
-            return uid, iter(())
+            return uid, ()
         else:
-            words = coalesce(proc.out.decode(), unifying_chars=unifying_chars)
-            return uid, words
-
-
-async def snapshot(unifying_chars: AbstractSet[str]) -> Mapping[str, Iterator[str]]:
-    shots = await gather(
-        *(
-            _screenshot(
-                unifying_chars=unifying_chars,
-                uid=pane.uid,
-            )
-            for pane in await _panes()
+            text = proc.out.decode()
+            return uid, _words(unifying_chars, uid=uid, text=text)
+
+
+async def _batched(uids: Sequence[str]) -> Optional[Sequence[str]]:
+    """
+    One `tmux` call for every pane, each capture followed by a fresh token
+    """
+
+    sep = uuid4().hex
+
+    def cmds() -> Iterator[str]:
+        for idx, uid in enumerate(uids):
+            if idx:
+                yield ";"
+            yield from ("capture-pane", "-p", "-t", uid)
+            yield from (";", "display-message", "-p", sep)
+
+    try:
+        proc = await call("tmux", *cmds(), check_returncode=set())
+    except FileNotFoundError:
+        return None
+    else:
+        if proc.code:
+            return None
+        else:
+            texts = proc.out.decode().split(sep)
+            return texts if len(texts) == len(uids) + 1 else None
+
+
+async def snapshot(unifying_chars: AbstractSet[str]) -> Mapping[str, Sequence[str]]:
+    uids = tuple(pane.uid for pane in await _panes())
+    texts = await _batched(uids) if uids else ()
+
+    if texts is None:
+        shots = await gather(
+            *(_screenshot(unifying_chars=unifying_chars, uid=uid) for uid in uids)
         )
-    )
-    snapshot = {uid: words for uid, words in shots}
+        snapshot = {uid: words for uid, words in shots}
+    else:
+        snapshot = {
+            uid: _words(unifying_chars, uid=uid, text=text)
+            for uid, text in zip(uids, texts)
+        }
+
+    for uid in _SHOTS.keys() - snapshot.keys():
+        _SHOTS.pop(uid, None)
     return snapshot
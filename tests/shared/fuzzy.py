@@ -1,6 +1,12 @@
 from unittest import TestCase
 
-from ...coq.shared.fuzzy import dl_distance, metrics, multi_set_ratio, quick_ratio
+from ...coq.shared.fuzzy import (
+    dl_distance,
+    metrics,
+    multi_set_ratio,
+    multi_set_ratios,
+    quick_ratio,
+)
 
 _LOOK_AHEAD = 2
 
@@ -37,6 +43,33 @@ class MultiSetRatio(TestCase):
         self.assertAlmostEqual(ratio, 2 / 3)
 
 
+class MultiSetRatios(TestCase):
+    def test_1(self) -> None:
+        lhs = ""
+        rhs = ("a", "")
+        ratios = multi_set_ratios(lhs, rhs, look_ahead=_LOOK_AHEAD)
+        self.assertEqual(ratios, [1, 1])
+
+    def test_2(self) -> None:
+        lhs = "fo"
+        rhs = ("xxxfoo", "foobar", "of")
+        ratios = multi_set_ratios(lhs, rhs, look_ahead=_LOOK_AHEAD)
+        self.assertEqual(ratios, [1 / 2, 1, 1])
+
+    def test_3(self) -> None:
+        lhs = "rn"
+        rhs = "return"
+        (ratio,) = multi_set_ratios(lhs, (rhs,), look_ahead=_LOOK_AHEAD)
+        self.assertAlmostEqual(ratio, 1 / 2)
+
+    def test_4(self) -> None:
+        lhs = "supervisor"
+        rhs = ("sup", "pervisor", "super", "visor", "", "zzz", "supervisorrr")
+        ratios = multi_set_ratios(lhs, rhs, look_ahead=_LOOK_AHEAD)
+        expected = [multi_set_ratio(lhs, r, look_ahead=_LOOK_AHEAD) for r in rhs]
+        self.assertEqual(ratios, expected)
+
+
 class QuickRatio(TestCase):
     def test_1(self) -> None:
         lhs = "a"
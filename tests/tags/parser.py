@@ -1,22 +1,22 @@
 from itertools import islice
 from os import linesep
 from shutil import get_terminal_size
-from unittest import IsolatedAsyncioTestCase
+from unittest import TestCase
 
 from ...coq.consts import TMP_DIR
-from ...coq.tags.parse import parse, run
+from ...coq.tags.parse import parse, stream
 
 
-class Parser(IsolatedAsyncioTestCase):
-    async def test_1(self) -> None:
+class Parser(TestCase):
+    def test_1(self) -> None:
         tag = TMP_DIR / "TAG"
         TMP_DIR.mkdir(parents=True, exist_ok=True)
         if not tag.exists():
-            text = await run("--recurse")
-            tag.write_text(text)
+            lines = list(stream("--recurse"))
+            tag.write_text("".join(lines))
 
         spec = tag.read_text()
-        parsed = parse({}, raw=spec)
+        parsed = parse({}, lines=spec.splitlines())
 
         cols, _ = get_terminal_size()
         sep = linesep + "-" * cols + linesep